@@ -0,0 +1,389 @@
+import asyncio
+import logging
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+import aiohttp
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from starlette.websockets import WebSocketState
+
+
+def env_to_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+ROUTER_REPLICAS = [url.strip().rstrip("/") for url in os.getenv("ROUTER_REPLICAS", "").split(",") if url.strip()]
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("ROUTER_PORT", "7870"))
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+POLL_INTERVAL_SEC = float(os.getenv("ROUTER_POLL_INTERVAL_SEC", "1.0"))
+HEALTH_TIMEOUT_SEC = float(os.getenv("ROUTER_HEALTH_TIMEOUT_SEC", "2.0"))
+UPSTREAM_TIMEOUT_SEC = float(os.getenv("ROUTER_UPSTREAM_TIMEOUT_SEC", "120"))
+RETRY_ATTEMPTS = int(os.getenv("ROUTER_RETRY_ATTEMPTS", "3"))
+RETRY_BACKOFF_SEC = float(os.getenv("ROUTER_RETRY_BACKOFF_SEC", "0.2"))
+WS_CLOSE_TIMEOUT_SEC = float(os.getenv("ROUTER_WS_CLOSE_TIMEOUT_SEC", "10"))
+WS_SESSION_WEIGHT = float(os.getenv("ROUTER_WS_SESSION_WEIGHT", "0.5"))
+MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "50"))
+ROUTE_UNREADY = env_to_bool("ROUTER_ROUTE_UNREADY", False)
+
+RETRY_STATUSES = frozenset({429, 503})
+HOP_BY_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailers",
+        "transfer-encoding",
+        "upgrade",
+        "host",
+        "content-length",
+        "content-encoding",
+    }
+)
+# uvicorn sets its own Date/Server on every response, so upstream copies would be duplicated.
+STRIPPED_RESPONSE_HEADERS = HOP_BY_HOP_HEADERS | {"date", "server"}
+
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format="%(asctime)s %(levelname)s %(name)s - %(message)s",
+)
+logger = logging.getLogger("sensevoice-router")
+
+
+@dataclass
+class Replica:
+    url: str
+    healthy: bool = False
+    ready: bool = False
+    max_concurrent: int = 1
+    reported_inflight: int = 0
+    reported_ws_sessions: int = 0
+    local_inflight: int = 0
+    local_ws_sessions: int = 0
+    last_error: Optional[str] = None
+    last_poll: float = 0.0
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and (self.ready or ROUTE_UNREADY)
+
+    @property
+    def load(self) -> float:
+        # Polled numbers lag behind; requests this router started since then are counted locally.
+        inflight = max(self.reported_inflight, self.local_inflight)
+        ws_sessions = max(self.reported_ws_sessions, self.local_ws_sessions)
+        return (inflight + WS_SESSION_WEIGHT * ws_sessions) / max(1, self.max_concurrent)
+
+    def status(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "ready": self.ready,
+            "load": round(self.load, 3),
+            "max_concurrent_inference": self.max_concurrent,
+            "inflight_inference": self.reported_inflight,
+            "ws_sessions": self.reported_ws_sessions,
+            "router_inflight": self.local_inflight,
+            "router_ws_sessions": self.local_ws_sessions,
+            "last_error": self.last_error,
+            "last_poll_age_sec": round(time.time() - self.last_poll, 2) if self.last_poll else None,
+        }
+
+
+class ReplayableBody:
+    """Streams the request body to the first upstream while keeping a capped copy for replays."""
+
+    def __init__(self, request: Request) -> None:
+        self._stream = request.stream()
+        self.buffer = bytearray()
+        self.started = False
+        self.complete = False
+        self.too_large = False
+
+    async def _tee(self):
+        self.started = True
+        async for chunk in self._stream:
+            self.buffer.extend(chunk)
+            if len(self.buffer) > MAX_UPLOAD_MB * 1024 * 1024:
+                self.too_large = True
+                raise HTTPException(status_code=413, detail=f"Body too large, max {MAX_UPLOAD_MB}MB")
+            yield chunk
+        self.complete = True
+
+    @property
+    def replayable(self) -> bool:
+        return not self.started or self.complete
+
+    def payload(self):
+        if self.complete:
+            return bytes(self.buffer)
+        return self._tee()
+
+
+class RouterService:
+    def __init__(self, replica_urls: list) -> None:
+        self.replicas = [Replica(url=url) for url in replica_urls]
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.poll_task: Optional[asyncio.Task] = None
+
+    async def startup(self) -> None:
+        if not self.replicas:
+            logger.warning("ROUTER_REPLICAS is empty, every request will fail with 503")
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=UPSTREAM_TIMEOUT_SEC),
+        )
+        await self.poll_all()
+        self.poll_task = asyncio.create_task(self._poll_loop())
+
+    async def shutdown(self) -> None:
+        if self.poll_task is not None:
+            self.poll_task.cancel()
+            try:
+                await self.poll_task
+            except asyncio.CancelledError:
+                pass
+        if self.session is not None:
+            await self.session.close()
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(POLL_INTERVAL_SEC)
+            await self.poll_all()
+
+    async def poll_all(self) -> None:
+        await asyncio.gather(*(self._poll(replica) for replica in self.replicas))
+
+    async def _poll(self, replica: Replica) -> None:
+        assert self.session is not None
+        try:
+            async with self.session.get(
+                f"{replica.url}/health", timeout=aiohttp.ClientTimeout(total=HEALTH_TIMEOUT_SEC)
+            ) as resp:
+                if resp.status != 200:
+                    raise RuntimeError(f"/health returned {resp.status}")
+                payload = await resp.json()
+        except Exception as exc:
+            if replica.healthy:
+                logger.warning("Replica %s marked unhealthy: %s", replica.url, exc)
+            replica.healthy = False
+            replica.last_error = str(exc) or type(exc).__name__
+            return
+        if not replica.healthy:
+            logger.info("Replica %s is reachable (ready=%s)", replica.url, payload.get("ready"))
+        replica.healthy = True
+        replica.ready = bool(payload.get("ready"))
+        replica.max_concurrent = int(payload.get("max_concurrent_inference") or 1)
+        replica.reported_inflight = int(payload.get("inflight_inference") or 0)
+        replica.reported_ws_sessions = int(payload.get("ws_sessions") or 0)
+        replica.last_error = payload.get("startup_error")
+        replica.last_poll = time.time()
+
+    def pick(self, exclude: set) -> Optional[Replica]:
+        candidates = [r for r in self.replicas if r.available and r.url not in exclude]
+        if not candidates:
+            return None
+        lowest = min(r.load for r in candidates)
+        return random.choice([r for r in candidates if r.load == lowest])
+
+    def health(self) -> dict:
+        return {
+            "replicas": [replica.status() for replica in self.replicas],
+            "available_replicas": sum(1 for r in self.replicas if r.available),
+        }
+
+    async def forward(self, request: Request, body: Optional[ReplayableBody]) -> Response:
+        assert self.session is not None
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+        path = request.url.path
+        tried: set = set()
+        last_response: Optional[Response] = None
+        for attempt in range(RETRY_ATTEMPTS):
+            if body is not None and not body.replayable:
+                # The upstream answered before the whole body arrived, so there is nothing to replay.
+                break
+            replica = self.pick(tried)
+            if replica is None:
+                # Every replica was tried or is down: wait a bit and give them all another chance.
+                tried.clear()
+                await asyncio.sleep(RETRY_BACKOFF_SEC * (2 ** attempt))
+                replica = self.pick(tried)
+                if replica is None:
+                    break
+            tried.add(replica.url)
+            replica.local_inflight += 1
+            try:
+                async with self.session.request(
+                    request.method,
+                    f"{replica.url}{path}",
+                    params=list(request.query_params.multi_items()),
+                    headers=headers,
+                    data=body.payload() if body is not None else None,
+                ) as resp:
+                    content = await resp.read()
+                    response_headers = {k: v for k, v in resp.headers.items() if k.lower() not in STRIPPED_RESPONSE_HEADERS}
+                    response_headers["X-Routed-To"] = replica.url
+                    response = Response(content=content, status_code=resp.status, headers=response_headers)
+            except HTTPException:
+                raise
+            except aiohttp.ClientConnectorError as exc:
+                # Nothing reached the replica, so trying another one cannot duplicate work.
+                logger.warning("Cannot connect to %s for %s %s: %s", replica.url, request.method, path, exc)
+                replica.healthy = False
+                replica.last_error = str(exc) or type(exc).__name__
+                continue
+            except asyncio.TimeoutError as exc:
+                # The replica may still be working on it; replaying would double the load.
+                logger.warning("Upstream %s timed out for %s %s", replica.url, request.method, path)
+                raise HTTPException(status_code=504, detail=f"Upstream timeout: {replica.url}") from exc
+            except aiohttp.ClientConnectionError as exc:
+                if body is not None and body.too_large:
+                    raise HTTPException(status_code=413, detail=f"Body too large, max {MAX_UPLOAD_MB}MB") from exc
+                logger.warning("Upstream %s failed for %s %s: %s", replica.url, request.method, path, exc)
+                replica.last_error = str(exc) or type(exc).__name__
+                raise HTTPException(status_code=502, detail=f"Upstream error: {replica.url}") from exc
+            finally:
+                replica.local_inflight -= 1
+            if resp.status in RETRY_STATUSES:
+                logger.info("Replica %s answered %s for %s, retrying elsewhere", replica.url, resp.status, path)
+                last_response = response
+                continue
+            return response
+        if last_response is not None:
+            return last_response
+        raise HTTPException(status_code=503, detail="No replica available")
+
+
+router_service = RouterService(ROUTER_REPLICAS)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await router_service.startup()
+    yield
+    await router_service.shutdown()
+
+
+app = FastAPI(title="SenseVoice Router", version="1.0.0", lifespan=lifespan)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+@app.get("/router/health")
+async def router_health():
+    return router_service.health()
+
+
+async def pump_client_to_upstream(ws: WebSocket, upstream: aiohttp.ClientWebSocketResponse) -> None:
+    while True:
+        message = await ws.receive()
+        if message.get("type") == "websocket.disconnect":
+            await upstream.close()
+            return
+        if message.get("bytes") is not None:
+            await upstream.send_bytes(message["bytes"])
+        elif message.get("text") is not None:
+            await upstream.send_str(message["text"])
+
+
+async def pump_upstream_to_client(ws: WebSocket, upstream: aiohttp.ClientWebSocketResponse) -> None:
+    async for message in upstream:
+        if message.type == aiohttp.WSMsgType.TEXT:
+            await ws.send_text(message.data)
+        elif message.type == aiohttp.WSMsgType.BINARY:
+            await ws.send_bytes(message.data)
+        elif message.type == aiohttp.WSMsgType.ERROR:
+            break
+
+
+@app.websocket("/ws/transcribe")
+@app.websocket("/ws")
+async def ws_proxy(ws: WebSocket):
+    assert router_service.session is not None
+    tried: set = set()
+    upstream = None
+    replica = None
+    # The session is pinned to whichever replica accepts the upgrade first.
+    for _ in range(RETRY_ATTEMPTS):
+        replica = router_service.pick(tried)
+        if replica is None:
+            break
+        tried.add(replica.url)
+        ws_url = replica.url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        try:
+            # ws_connect's timeout only covers close/receive, so the upgrade handshake is bounded here.
+            upstream = await asyncio.wait_for(
+                router_service.session.ws_connect(
+                    f"{ws_url}{ws.url.path}",
+                    params=list(ws.query_params.multi_items()),
+                    timeout=aiohttp.ClientWSTimeout(ws_close=WS_CLOSE_TIMEOUT_SEC),
+                ),
+                timeout=HEALTH_TIMEOUT_SEC,
+            )
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.warning("WebSocket upstream %s failed: %s", replica.url, exc)
+            if not isinstance(exc, aiohttp.WSServerHandshakeError):
+                replica.healthy = False
+            replica.last_error = str(exc) or type(exc).__name__
+    if upstream is None or replica is None:
+        await ws.close(code=1013)
+        return
+
+    await ws.accept()
+    replica.local_ws_sessions += 1
+    tasks = [
+        asyncio.create_task(pump_client_to_upstream(ws, upstream)),
+        asyncio.create_task(pump_upstream_to_client(ws, upstream)),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exc = task.exception()
+            # A client disconnect is the normal way a session ends; anything else is worth a log line.
+            if exc is not None and not isinstance(exc, WebSocketDisconnect):
+                logger.warning("WebSocket proxy to %s ended with error: %r", replica.url, exc)
+    finally:
+        replica.local_ws_sessions -= 1
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if not upstream.closed:
+            await upstream.close()
+        try:
+            if ws.application_state in {WebSocketState.CONNECTED, WebSocketState.CONNECTING}:
+                await ws.close()
+        except (RuntimeError, WebSocketDisconnect):
+            # Close frame may already be sent by server/client side.
+            pass
+
+
+@app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
+async def proxy(path: str, request: Request):
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_MB * 1024 * 1024:
+        raise HTTPException(status_code=413, detail=f"Body too large, max {MAX_UPLOAD_MB}MB")
+    has_body = content_length not in {None, "0"} or "chunked" in request.headers.get("transfer-encoding", "")
+    body = ReplayableBody(request) if has_body else None
+    return await router_service.forward(request, body)
+
+
+if __name__ == "__main__":
+    uvicorn.run("router:app", host=HOST, port=PORT, log_level=LOG_LEVEL.lower())
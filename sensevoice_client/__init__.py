@@ -0,0 +1,14 @@
+"""Asyncio client for the SenseVoice service."""
+
+from .client import AsyncSenseVoiceClient, RetryPolicy, SenseVoiceError
+from .streaming import StreamingSession
+
+__version__ = "0.1.0"
+
+__all__ = [
+    "AsyncSenseVoiceClient",
+    "RetryPolicy",
+    "SenseVoiceError",
+    "StreamingSession",
+    "__version__",
+]
@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import aiohttp
+
+from .client import DEFAULT_BASE_URL, AsyncSenseVoiceClient, RetryPolicy, SenseVoiceError
+
+AUDIO_SUFFIXES = {".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg", ".opus", ".webm", ".amr", ".pcm"}
+
+
+def collect_inputs(source: Path, recursive: bool) -> List[Path]:
+    """Raises ValueError with a user-facing message for a missing source or bad manifest line."""
+    if not source.exists():
+        raise ValueError(f"Source not found: {source}")
+    if source.is_dir():
+        pattern = "**/*" if recursive else "*"
+        return sorted(p for p in source.glob(pattern) if p.is_file() and p.suffix.lower() in AUDIO_SUFFIXES)
+    # Manifest: one path per line, or JSON lines with a "path" field; relative paths resolve against the manifest.
+    try:
+        lines = source.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Cannot read manifest {source}: {exc}") from exc
+    paths = []
+    for lineno, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{source}:{lineno}: invalid JSON ({exc})") from exc
+            if not isinstance(entry.get("path"), str) or not entry["path"]:
+                raise ValueError(f"{source}:{lineno}: missing 'path' field")
+            entry = entry["path"]
+        else:
+            entry = line
+        path = Path(entry)
+        paths.append(path if path.is_absolute() else source.parent / path)
+    return paths
+
+
+class Progress:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.audio_sec = 0.0
+        self.started = time.perf_counter()
+
+    def update(self, result: Optional[dict]) -> None:
+        self.done += 1
+        if result is None:
+            self.failed += 1
+        else:
+            self.audio_sec += float(result.get("audio_duration") or 0.0)
+        elapsed = max(time.perf_counter() - self.started, 1e-6)
+        print(
+            f"\r[{self.done}/{self.total}] failed={self.failed} "
+            f"{self.done / elapsed:.2f} files/s, {self.audio_sec / elapsed:.1f}x realtime",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    def summary(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        return (
+            f"{self.done - self.failed}/{self.total} ok, {self.failed} failed, "
+            f"{self.audio_sec:.1f}s audio in {elapsed:.1f}s wall"
+        )
+
+
+async def transcribe_one(client: AsyncSenseVoiceClient, path: Path, args: argparse.Namespace) -> dict:
+    if path.suffix.lower() == ".pcm":
+        pcm = await asyncio.to_thread(path.read_bytes)
+        return await client.transcribe_pcm(pcm, language=args.language, use_itn=args.use_itn)
+    return await client.transcribe_file(path, language=args.language, use_itn=args.use_itn, per_channel=args.per_channel)
+
+
+async def run(args: argparse.Namespace) -> int:
+    try:
+        paths = collect_inputs(Path(args.source), args.recursive)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    if not paths:
+        print(f"No audio files found in {args.source}", file=sys.stderr)
+        return 1
+    progress = Progress(len(paths))
+    semaphore = asyncio.Semaphore(args.concurrency)
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    retry = RetryPolicy(attempts=args.retries + 1)
+
+    async with AsyncSenseVoiceClient(args.url, max_connections=args.concurrency, timeout_sec=args.timeout, retry=retry) as client:
+
+        async def worker(path: Path) -> None:
+            async with semaphore:
+                record = {"path": str(path)}
+                try:
+                    result = await transcribe_one(client, path, args)
+                    record.update(result)
+                except (SenseVoiceError, aiohttp.ClientError, OSError, asyncio.TimeoutError) as exc:
+                    result = None
+                    record["error"] = str(exc)
+                progress.update(result)
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+
+        try:
+            await asyncio.gather(*(worker(path) for path in paths))
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+    print(f"\n{progress.summary()}", file=sys.stderr)
+    return 0 if progress.failed == 0 else 2
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="sensevoice-client", description="Transcribe a directory or manifest of audio files concurrently.")
+    parser.add_argument("source", help="Directory of audio files, or a manifest (.txt paths / .jsonl with a 'path' field)")
+    parser.add_argument("--url", default=DEFAULT_BASE_URL, help="Service base URL (default: %(default)s)")
+    parser.add_argument("-j", "--concurrency", type=int, default=4, help="Max in-flight requests (default: %(default)s)")
+    parser.add_argument("-o", "--output", help="Write JSON lines here instead of stdout")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Recurse into subdirectories")
+    parser.add_argument("--language", default="auto")
+    parser.add_argument("--use-itn", dest="use_itn", action="store_true", default=None)
+    parser.add_argument("--no-itn", dest="use_itn", action="store_false")
+    parser.add_argument("--per-channel", action="store_true", help="Transcribe each channel separately (not for .pcm)")
+    parser.add_argument("--retries", type=int, default=2, help="Retries on 429/503 and connect failures (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-request timeout in seconds (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.concurrency < 1:
+        print("--concurrency must be >= 1", file=sys.stderr)
+        return 1
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import os
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterable, Optional, Union
+
+import aiohttp
+
+from .streaming import StreamingSession
+
+logger = logging.getLogger("sensevoice-client")
+
+DEFAULT_BASE_URL = os.getenv("SENSEVOICE_URL", "http://127.0.0.1:7860")
+# 429/503 mean the request was turned away; 502/504 may leave inference running on the server.
+RETRY_STATUSES = frozenset({429, 503})
+
+
+class SenseVoiceError(Exception):
+    def __init__(self, status: int, detail: str) -> None:
+        super().__init__(f"HTTP {status}: {detail}")
+        self.status = status
+        self.detail = detail
+
+
+@dataclass
+class RetryPolicy:
+    """By default only retries requests the server never started; widen ``statuses``/``retry_in_flight`` to opt in."""
+
+    attempts: int = 3
+    backoff_base_sec: float = 0.5
+    backoff_max_sec: float = 8.0
+    statuses: frozenset = field(default_factory=lambda: RETRY_STATUSES)
+    # Also retry timeouts and connections dropped mid-request, which can duplicate server-side work.
+    retry_in_flight: bool = False
+
+    def should_retry_error(self, exc: BaseException) -> bool:
+        if isinstance(exc, aiohttp.ClientConnectorError):
+            return True
+        return self.retry_in_flight and isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max_sec)
+        delay = min(self.backoff_base_sec * (2 ** attempt), self.backoff_max_sec)
+        # Full jitter keeps many clients from retrying in lockstep.
+        return random.uniform(0, delay)
+
+
+class AsyncSenseVoiceClient:
+    """Pooled HTTP/WebSocket client; use as ``async with AsyncSenseVoiceClient(url) as client``."""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        max_connections: int = 16,
+        timeout_sec: float = 120.0,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout_sec = timeout_sec
+        self.retry = retry or RetryPolicy()
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> "AsyncSenseVoiceClient":
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_sec),
+            )
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and self._owns_session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request_json(self, method: str, path: str, build_kwargs, retryable: bool = True) -> dict:
+        session = self._ensure_session()
+        url = f"{self.base_url}{path}"
+        attempts = self.retry.attempts if retryable else 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                async with session.request(method, url, **build_kwargs()) as resp:
+                    if resp.status in self.retry.statuses and not last_attempt:
+                        delay = self.retry.delay(attempt, resp.headers.get("Retry-After"))
+                        logger.warning("%s %s -> %s, retrying in %.2fs", method, path, resp.status, delay)
+                        await asyncio.sleep(delay)
+                        continue
+                    if resp.status >= 400:
+                        try:
+                            detail = (await resp.json()).get("detail", "")
+                        except (aiohttp.ContentTypeError, ValueError):
+                            detail = await resp.text()
+                        raise SenseVoiceError(resp.status, str(detail))
+                    return await resp.json()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if last_attempt or not self.retry.should_retry_error(exc):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning("%s %s failed (%s), retrying in %.2fs", method, path, exc, delay)
+                await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
+
+    async def health(self) -> dict:
+        return await self._request_json("GET", "/health", dict)
+
+    async def transcribe_pcm(
+        self,
+        pcm: Union[bytes, bytearray, AsyncIterable[bytes]],
+        language: str = "auto",
+        use_itn: Optional[bool] = None,
+    ) -> dict:
+        """Send 16kHz mono int16 PCM. Async iterables are streamed chunked and are not retried."""
+        params = {"language": language}
+        if use_itn is not None:
+            params["use_itn"] = str(use_itn).lower()
+        headers = {"Content-Type": "application/octet-stream"}
+        retryable = isinstance(pcm, (bytes, bytearray))
+        return await self._request_json(
+            "POST",
+            "/api/transcribe/pcm",
+            lambda: {"data": pcm, "params": params, "headers": headers},
+            retryable=retryable,
+        )
+
+    async def transcribe_file(
+        self,
+        path: Union[str, Path],
+        language: str = "auto",
+        use_itn: Optional[bool] = None,
+        per_channel: bool = False,
+    ) -> dict:
+        """Upload an audio file; ``per_channel`` returns one transcript (with segments) per channel."""
+        path = Path(path)
+        payload = await asyncio.to_thread(path.read_bytes)
+        params = {"language": language}
+        if use_itn is not None:
+            params["use_itn"] = str(use_itn).lower()
+        if per_channel:
+            params["per_channel"] = "true"
+
+        def build_kwargs() -> dict:
+            form = aiohttp.FormData()
+            form.add_field("file", payload, filename=path.name, content_type="application/octet-stream")
+            return {"data": form, "params": params}
+
+        return await self._request_json("POST", "/api/transcribe/file", build_kwargs)
+
+    def stream(self, language: str = "auto", use_itn: Optional[bool] = None, on_partial=None) -> StreamingSession:
+        """Open a ``/ws/transcribe`` session; use as ``async with client.stream() as session``."""
+        ws_url = self.base_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        params = {"language": language}
+        if use_itn is not None:
+            params["use_itn"] = str(use_itn).lower()
+        return StreamingSession(self._ensure_session(), f"{ws_url}/ws/transcribe", params, on_partial=on_partial)
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Optional, Union
+
+import aiohttp
+
+logger = logging.getLogger("sensevoice-client")
+
+PartialCallback = Callable[[dict], Union[None, Awaitable[None]]]
+
+
+class StreamingSession:
+    """WebSocket session that handles ``ready``/``partial``/``final`` events from ``/ws/transcribe``."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: dict,
+        on_partial: Optional[PartialCallback] = None,
+        ready_timeout_sec: float = 30.0,
+    ) -> None:
+        self._session = session
+        self._url = url
+        self._params = params
+        self._on_partial = on_partial
+        self._ready_timeout_sec = ready_timeout_sec
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._finals: asyncio.Queue = asyncio.Queue()
+        self._ready = asyncio.Event()
+        self.sample_rate: Optional[int] = None
+        self.last_partial: Optional[dict] = None
+
+    async def __aenter__(self) -> "StreamingSession":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        self._ws = await self._session.ws_connect(self._url, params=self._params, heartbeat=20)
+        self._reader = asyncio.create_task(self._read_loop())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self._ready_timeout_sec)
+        except BaseException:
+            # __aexit__ does not run when __aenter__ fails, so release the socket and reader here.
+            await self.close()
+            raise
+
+    async def _read_loop(self) -> None:
+        assert self._ws is not None
+        try:
+            await self._dispatch()
+        except Exception:
+            logger.exception("WebSocket reader stopped")
+        finally:
+            # Wake up anyone still waiting for a final result.
+            await self._finals.put({"event": "closed"})
+
+    async def _dispatch(self) -> None:
+        assert self._ws is not None
+        async for msg in self._ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+            try:
+                payload = json.loads(msg.data)
+            except json.JSONDecodeError:
+                logger.warning("Ignoring malformed WebSocket frame: %.200s", msg.data)
+                continue
+            event = payload.get("event")
+            if event == "ready":
+                self.sample_rate = payload.get("sample_rate")
+                self._ready.set()
+            elif event == "partial":
+                self.last_partial = payload
+                if self._on_partial is not None:
+                    try:
+                        maybe_awaitable = self._on_partial(payload)
+                        if asyncio.iscoroutine(maybe_awaitable):
+                            await maybe_awaitable
+                    except Exception:
+                        logger.exception("on_partial callback failed")
+            elif event in {"final", "error"}:
+                await self._finals.put(payload)
+            elif event == "closed":
+                break
+
+    async def send_audio(self, pcm: bytes) -> None:
+        """Send a chunk of 16kHz mono int16 PCM."""
+        if self._ws is None:
+            raise RuntimeError("Streaming session is not connected")
+        await self._ws.send_bytes(pcm)
+
+    async def _command(self, event: str) -> dict:
+        if self._ws is None:
+            raise RuntimeError("Streaming session is not connected")
+        await self._ws.send_json({"event": event})
+        result = await self._finals.get()
+        if result.get("event") == "error":
+            raise RuntimeError(result.get("detail", "WebSocket error"))
+        if result.get("event") == "closed":
+            raise ConnectionError("WebSocket closed before final result")
+        return result
+
+    async def flush(self) -> dict:
+        """Finalize the current utterance and keep the session open."""
+        return await self._command("flush")
+
+    async def end(self) -> dict:
+        """Finalize the current utterance and close the session."""
+        result = await self._command("end")
+        await self.close()
+        return result
+
+    async def close(self) -> None:
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        if self._reader is not None:
+            try:
+                await asyncio.wait_for(self._reader, timeout=5)
+            except (asyncio.TimeoutError, aiohttp.ClientError):
+                self._reader.cancel()
+        self._ws = None
+        self._reader = None
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import kaldi_native_fbank as knf
 import numpy as np
 import uvicorn
 from fastapi import FastAPI, File, HTTPException, Request, UploadFile, WebSocket, WebSocketDisconnect
@@ -54,10 +55,21 @@ INFERENCE_TIMEOUT_SEC = float(os.getenv("INFERENCE_TIMEOUT_SEC", "45"))
 MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "50"))
 WS_PARTIAL_INTERVAL_SEC = float(os.getenv("WS_PARTIAL_INTERVAL_SEC", "1.2"))
 WS_MAX_BUFFER_SEC = float(os.getenv("WS_MAX_BUFFER_SEC", "30"))
+WS_CASCADE = env_to_bool("WS_CASCADE", False)
+WS_PARTIAL_WINDOW_SEC = float(os.getenv("WS_PARTIAL_WINDOW_SEC", "0"))
+MAX_CONCURRENT_PARTIAL_INFERENCE = int(os.getenv("MAX_CONCURRENT_PARTIAL_INFERENCE", str(MAX_CONCURRENT_INFERENCE)))
 AUTO_MERGE_ON_STARTUP = env_to_bool("AUTO_MERGE_ON_STARTUP", True)
+PCM_TRIM_SILENCE = env_to_bool("PCM_TRIM_SILENCE", True)
+PCM_SILENCE_THRESHOLD = float(os.getenv("PCM_SILENCE_THRESHOLD", "0.003"))
+PCM_SILENCE_PAD_SEC = float(os.getenv("PCM_SILENCE_PAD_SEC", "0.3"))
+SEGMENT_MIN_SILENCE_SEC = float(os.getenv("SEGMENT_MIN_SILENCE_SEC", "0.5"))
+SEGMENT_MAX_SEC = float(os.getenv("SEGMENT_MAX_SEC", "30"))
+PER_CHANNEL_BATCH_SIZE = int(os.getenv("PER_CHANNEL_BATCH_SIZE", "16"))
 
 SAMPLE_RATE = 16000
 MIN_PCM_BYTES = 320
+VAD_FRAME_SAMPLES = 480
+MIN_SEGMENT_SAMPLES = SAMPLE_RATE // 10
 TAG_PATTERN = re.compile(r"<\|.*?\|>")
 
 logging.basicConfig(
@@ -98,7 +110,32 @@ def read_wav_as_float32(path: str) -> np.ndarray:
     return np.ascontiguousarray(audio, dtype=np.float32)
 
 
-def decode_audio_via_ffmpeg(file_bytes: bytes, filename: str) -> np.ndarray:
+def probe_channel_count(input_path: str) -> int:
+    ffprobe_path = shutil.which("ffprobe")
+    if not ffprobe_path:
+        raise RuntimeError("ffprobe not found. Please install ffmpeg first.")
+    cmd = [
+        ffprobe_path,
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "stream=channels",
+        "-of",
+        "csv=p=0",
+        input_path,
+    ]
+    completed = subprocess.run(cmd, capture_output=True, text=True)
+    output = completed.stdout.strip()
+    if completed.returncode != 0 or not output.isdigit() or int(output) < 1:
+        stderr_tail = completed.stderr[-500:] if completed.stderr else "no audio stream found"
+        raise RuntimeError(f"ffprobe failed: {stderr_tail}")
+    return int(output)
+
+
+def decode_audio_via_ffmpeg(file_bytes: bytes, filename: str, mix_down: bool = True) -> np.ndarray:
+    """Returns mono audio, or a (channels, samples) array when ``mix_down`` is False."""
     ffmpeg_path = shutil.which("ffmpeg")
     if not ffmpeg_path:
         raise RuntimeError("ffmpeg not found. Please install ffmpeg first.")
@@ -108,25 +145,89 @@ def decode_audio_via_ffmpeg(file_bytes: bytes, filename: str) -> np.ndarray:
         output_path = os.path.join(temp_dir, "output.wav")
         with open(input_path, "wb") as f:
             f.write(file_bytes)
-        cmd = [
-            ffmpeg_path,
-            "-nostdin",
-            "-y",
-            "-i",
-            input_path,
-            "-ac",
-            "1",
-            "-ar",
-            str(SAMPLE_RATE),
-            "-f",
-            "wav",
-            output_path,
-        ]
+        if mix_down:
+            cmd = [ffmpeg_path, "-nostdin", "-y", "-i", input_path, "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "wav", output_path]
+        else:
+            # Raw PCM instead of WAV: ffmpeg writes WAVE_FORMAT_EXTENSIBLE above 2 channels, which `wave` cannot read.
+            channels = probe_channel_count(input_path)
+            output_path = os.path.join(temp_dir, "output.pcm")
+            cmd = [
+                ffmpeg_path,
+                "-nostdin",
+                "-y",
+                "-i",
+                input_path,
+                "-map",
+                "0:a:0",
+                "-ac",
+                str(channels),
+                "-ar",
+                str(SAMPLE_RATE),
+                "-f",
+                "s16le",
+                output_path,
+            ]
         completed = subprocess.run(cmd, capture_output=True, text=True)
         if completed.returncode != 0:
             stderr_tail = completed.stderr[-500:] if completed.stderr else "unknown ffmpeg error"
             raise RuntimeError(f"ffmpeg convert failed: {stderr_tail}")
-        return read_wav_as_float32(output_path)
+        if mix_down:
+            return read_wav_as_float32(output_path)
+        with open(output_path, "rb") as f:
+            audio = pcm16_bytes_to_float32(f.read())
+        frames = audio.size // channels
+        return np.ascontiguousarray(audio[: frames * channels].reshape(frames, channels).T, dtype=np.float32)
+
+
+def frame_rms(samples: np.ndarray) -> np.ndarray:
+    """RMS per VAD_FRAME_SAMPLES frame; a trailing partial frame is zero-padded."""
+    frame_count = -(-samples.size // VAD_FRAME_SAMPLES)
+    frames = np.zeros(frame_count * VAD_FRAME_SAMPLES, dtype=np.float32)
+    frames[: samples.size] = samples
+    return np.sqrt(np.mean(np.square(frames.reshape(frame_count, VAD_FRAME_SAMPLES)), axis=1))
+
+
+def split_long_range(rms: np.ndarray, start: int, end: int, max_len: int) -> list:
+    """Splits [start, end) into pieces of at most max_len, cutting at the quietest frame of each window's second half."""
+    pieces = []
+    while end - start > max_len:
+        lo = -(-(start + max_len // 2) // VAD_FRAME_SAMPLES)
+        hi = (start + max_len) // VAD_FRAME_SAMPLES - 1
+        if hi >= lo:
+            quietest = lo + int(np.argmin(rms[lo : hi + 1]))
+            cut = quietest * VAD_FRAME_SAMPLES + VAD_FRAME_SAMPLES // 2
+        else:
+            cut = start + max_len
+        pieces.append((start, cut))
+        start = cut
+    if end - start >= MIN_SEGMENT_SAMPLES:
+        pieces.append((start, end))
+    return pieces
+
+
+def split_voiced_segments(audio: np.ndarray) -> list:
+    """Energy-VAD segmentation into padded (start, end) sample ranges, each at most SEGMENT_MAX_SEC long."""
+    if audio.size == 0 or not np.any(audio):
+        return []
+    rms = frame_rms(audio)
+    max_len = max(MIN_SEGMENT_SAMPLES, int(SAMPLE_RATE * SEGMENT_MAX_SEC))
+    voiced = np.flatnonzero(rms > PCM_SILENCE_THRESHOLD)
+    if voiced.size == 0:
+        # Nothing crossed the fixed threshold (e.g. a low-gain customer leg): transcribe it whole instead of dropping it.
+        return split_long_range(rms, 0, audio.size, max_len)
+    gap_frames = max(1, int(SAMPLE_RATE * SEGMENT_MIN_SILENCE_SEC) // VAD_FRAME_SAMPLES)
+    breaks = np.flatnonzero(np.diff(voiced) > gap_frames)
+    starts = np.concatenate(([voiced[0]], voiced[breaks + 1]))
+    ends = np.concatenate((voiced[breaks], [voiced[-1]])) + 1
+    pad = int(SAMPLE_RATE * PCM_SILENCE_PAD_SEC)
+    segments = []
+    prev_end = 0
+    for start_frame, end_frame in zip(starts, ends):
+        start = max(prev_end, int(start_frame) * VAD_FRAME_SAMPLES - pad)
+        end = min(audio.size, int(end_frame) * VAD_FRAME_SAMPLES + pad)
+        segments.extend(split_long_range(rms, start, end, max_len))
+        prev_end = end
+    return segments
 
 
 @dataclass
@@ -165,6 +266,101 @@ class StreamSession:
     def as_float32(self) -> np.ndarray:
         return pcm16_bytes_to_float32(bytes(self.raw_pcm))
 
+    def tail_float32(self, window_sec: float) -> np.ndarray:
+        if window_sec <= 0:
+            return self.as_float32()
+        window_bytes = int(SAMPLE_RATE * window_sec) * 2
+        return pcm16_bytes_to_float32(bytes(self.raw_pcm[-window_bytes:]))
+
+
+@dataclass
+class PCMUploadBuffer:
+    """Runs the energy VAD and fbank extraction on a PCM upload chunk by chunk, while the body is still arriving."""
+
+    max_bytes: int
+    trim_silence: bool
+    pad_samples: int
+    fbank: Optional[knf.OnlineFbank]
+    frame_shift: int
+    frame_length: int
+    carry: bytearray
+    received_bytes: int
+    num_samples: int
+    voice_start: Optional[int]
+    voice_end: int
+
+    @classmethod
+    def create(cls, fbank_opts: Optional[knf.FbankOptions] = None, trim_silence: bool = PCM_TRIM_SILENCE) -> "PCMUploadBuffer":
+        frame_shift, frame_length = 1, 1
+        if fbank_opts is not None:
+            frame_shift = int(SAMPLE_RATE * fbank_opts.frame_opts.frame_shift_ms / 1000)
+            frame_length = int(SAMPLE_RATE * fbank_opts.frame_opts.frame_length_ms / 1000)
+        return cls(
+            max_bytes=MAX_UPLOAD_MB * 1024 * 1024,
+            trim_silence=trim_silence,
+            pad_samples=max(0, int(SAMPLE_RATE * PCM_SILENCE_PAD_SEC)),
+            fbank=knf.OnlineFbank(fbank_opts) if fbank_opts is not None else None,
+            frame_shift=frame_shift,
+            frame_length=frame_length,
+            carry=bytearray(),
+            received_bytes=0,
+            num_samples=0,
+            voice_start=None,
+            voice_end=0,
+        )
+
+    def feed(self, chunk: bytes) -> None:
+        self.received_bytes += len(chunk)
+        if self.received_bytes > self.max_bytes:
+            raise HTTPException(status_code=413, detail=f"PCM body too large, max {MAX_UPLOAD_MB}MB")
+        self.carry.extend(chunk)
+        frame_bytes = VAD_FRAME_SAMPLES * 2
+        usable = len(self.carry) - len(self.carry) % frame_bytes
+        if usable:
+            self._push(pcm16_bytes_to_float32(bytes(self.carry[:usable])))
+            del self.carry[:usable]
+
+    def _push(self, samples: np.ndarray) -> None:
+        if samples.size == 0:
+            return
+        if self.fbank is not None:
+            self.fbank.accept_waveform(SAMPLE_RATE, (samples * 32768.0).tolist())
+        if self.trim_silence:
+            # Feeds are whole VAD frames; only the tail pushed by finish() can be partial.
+            voiced = np.flatnonzero(frame_rms(samples) > PCM_SILENCE_THRESHOLD)
+            if voiced.size:
+                if self.voice_start is None:
+                    self.voice_start = self.num_samples + int(voiced[0]) * VAD_FRAME_SAMPLES
+                self.voice_end = min(self.num_samples + (int(voiced[-1]) + 1) * VAD_FRAME_SAMPLES, self.num_samples + samples.size)
+        self.num_samples += samples.size
+
+    def trim_bounds(self) -> tuple:
+        """Sample range sent to the model; the whole upload when trimming is off or nothing crossed the threshold."""
+        if not self.trim_silence or self.voice_start is None:
+            return 0, self.num_samples
+        start = max(self.voice_start - self.pad_samples, 0)
+        # Align to the fbank grid so the kept frames equal an fbank computed on the trimmed audio alone.
+        start -= start % self.frame_shift
+        end = min(self.voice_end + self.pad_samples, self.num_samples)
+        return start, end
+
+    def finish(self) -> tuple:
+        """Returns (fbank frames of the kept range, kept sample count); frames are None without fbank options."""
+        if self.carry:
+            self._push(pcm16_bytes_to_float32(bytes(self.carry)))
+            self.carry.clear()
+        start, end = self.trim_bounds()
+        if self.fbank is None:
+            return None, end - start
+        self.fbank.input_finished()
+        first = start // self.frame_shift
+        count = 0 if end - start < self.frame_length else 1 + (end - start - self.frame_length) // self.frame_shift
+        count = max(0, min(count, self.fbank.num_frames_ready - first))
+        feats = np.empty((count, self.fbank.dim), dtype=np.float32)
+        for i in range(count):
+            feats[i] = self.fbank.get_frame(first + i)
+        return feats, end - start
+
 
 class ASRService:
     def __init__(self) -> None:
@@ -176,6 +372,15 @@ class ASRService:
         self.model_size_mb = 0.0
         self.quantize = False
         self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_INFERENCE)
+        # Load signals reported via /health for the router: queued + running inferences, open WS sessions.
+        self.inflight = 0
+        self.ws_sessions = 0
+        # Cascade mode: partials run on a cheaper model with their own pool, finals keep the main model.
+        # Only enabled once a separate quantized model is loaded; otherwise partials share the main pool.
+        self.cascade = False
+        self.partial_model: Optional[SenseVoiceSmall] = None
+        self.partial_model_name: Optional[str] = None
+        self.partial_semaphore = self.semaphore
 
     def _detect_model(self) -> None:
         model_dir = Path(MODEL_PATH)
@@ -204,15 +409,17 @@ class ASRService:
             raise RuntimeError("ONNX model fragments detected. Enable AUTO_MERGE_ON_STARTUP or run ./auto_merge.sh first.")
         raise RuntimeError(f"No model.onnx/model_quant.onnx/model_full.onnx under {model_dir.resolve()}")
 
-    def _merge_model_fragments(self) -> None:
+    def _merge_model_fragments(self, target: Optional[str] = None) -> None:
         workspace_root = Path(__file__).resolve().parent
         script_path = workspace_root / "auto_merge.sh"
         if not script_path.exists():
             raise RuntimeError(f"Detected model fragments but {script_path} not found")
-        logger.info("Detected model fragments, running auto_merge.sh before loading model")
+        logger.info("Detected model fragments, running auto_merge.sh before loading %s", target or "model")
+        env = dict(os.environ, AUTO_MERGE_TARGET=target) if target else None
         completed = subprocess.run(
             ["bash", str(script_path)],
             cwd=str(workspace_root),
+            env=env,
             capture_output=True,
             text=True,
         )
@@ -229,12 +436,38 @@ class ASRService:
         dummy = np.zeros(SAMPLE_RATE, dtype=np.float32)
         warmup_textnorm = "withitn" if DEFAULT_USE_ITN else "woitn"
         self.model(dummy, language="auto", textnorm=warmup_textnorm)
+        if WS_CASCADE:
+            self._load_partial_model(dummy, warmup_textnorm)
         self.ready = True
         logger.info("Model ready, service listening on port %s", PORT)
 
+    def _load_partial_model(self, dummy: np.ndarray, warmup_textnorm: str) -> None:
+        if self.quantize:
+            logger.error("WS_CASCADE ignored: main model is already %s, cascade disabled", self.model_name)
+            return
+        quant_path = Path(MODEL_PATH) / "model_quant.onnx"
+        # The quantized model only serves optional partials, so a failure here must not take the service down.
+        try:
+            if not quant_path.exists() and AUTO_MERGE_ON_STARTUP and quant_path.with_name(f"{quant_path.name}.part000").exists():
+                self._merge_model_fragments(target=quant_path.name)
+            if not quant_path.exists():
+                logger.error("WS_CASCADE ignored: %s not found, cascade disabled", quant_path)
+                return
+            logger.info("Cascade mode: loading %s for partial hypotheses", quant_path.name)
+            partial_model = SenseVoiceSmall(model_dir=MODEL_PATH, quantize=True, intra_op_num_threads=INTRA_THREADS)
+            partial_model(dummy, language="auto", textnorm=warmup_textnorm)
+        except Exception:
+            logger.exception("WS_CASCADE ignored: failed to load %s, cascade disabled", quant_path)
+            return
+        self.partial_model = partial_model
+        self.partial_model_name = quant_path.name
+        self.cascade = True
+
     async def startup(self) -> None:
         try:
             await asyncio.to_thread(self._load_sync)
+            if self.cascade:
+                self.partial_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PARTIAL_INFERENCE)
             self.startup_error = None
         except Exception as exc:
             self.ready = False
@@ -244,19 +477,74 @@ class ASRService:
     async def shutdown(self) -> None:
         self.ready = False
         self.model = None
+        self.partial_model = None
+        self.cascade = False
+        self.partial_semaphore = self.semaphore
 
-    def _infer_sync(self, audio: np.ndarray, language: str, use_itn: bool) -> str:
-        if self.model is None:
+    def _infer_sync(self, audio: np.ndarray, language: str, use_itn: bool, partial: bool = False) -> str:
+        model = self.partial_model if partial and self.partial_model is not None else self.model
+        if model is None:
             raise RuntimeError("Model not loaded")
         textnorm = "withitn" if use_itn else "woitn"
-        result = self.model(audio, language=language, textnorm=textnorm)
+        result = model(audio, language=language, textnorm=textnorm)
         if isinstance(result, list):
             text = result[0] if result else ""
         else:
             text = str(result)
         return clean_text(text)
 
-    async def transcribe(self, audio: np.ndarray, language: str = "auto", use_itn: bool = False) -> dict:
+    def _infer_fbank_batch_sync(self, fbanks: list, language: str, use_itn: bool) -> list:
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        model = self.model
+        textnorm = "withitn" if use_itn else "woitn"
+        # Mirrors SenseVoiceSmall.__call__ from the fbank stage on, which lets callers batch arrays and
+        # compute fbank ahead of time (its __call__ treats a list as file paths).
+        feats, feats_len = [], []
+        for fbank in fbanks:
+            feat, feat_len = model.frontend.lfr_cmvn(fbank)
+            feats.append(feat)
+            feats_len.append(feat_len)
+        feats = model.pad_feats(feats, np.max(feats_len))
+        feats_len = np.array(feats_len).astype(np.int32)
+        size = feats.shape[0]
+        ctc_logits, encoder_out_lens = model.infer(
+            feats,
+            feats_len,
+            np.array([model._get_lid(language)] * size, dtype=np.int32),
+            np.array([model._get_tnid(textnorm)] * size, dtype=np.int32),
+        )
+        texts = []
+        for b in range(size):
+            yseq = np.argmax(ctc_logits[b, : int(encoder_out_lens[b]), :], axis=-1)
+            yseq = yseq[np.concatenate(([True], np.diff(yseq) != 0))]
+            texts.append(clean_text(model.tokenizer.decode(yseq[yseq != model.blank_id].tolist())))
+        return texts
+
+    def _infer_batch_sync(self, audios: list, language: str, use_itn: bool) -> list:
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        fbanks = [self.model.frontend.fbank(audio)[0] for audio in audios]
+        return self._infer_fbank_batch_sync(fbanks, language, use_itn)
+
+    def fbank_options(self) -> knf.FbankOptions:
+        if not self.ready or self.model is None:
+            detail = self.startup_error or "Model is not ready"
+            raise HTTPException(status_code=503, detail=detail)
+        return self.model.frontend.opts
+
+    async def _run_inference(self, semaphore: asyncio.Semaphore, func, *args):
+        self.inflight += 1
+        try:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(asyncio.to_thread(func, *args), timeout=INFERENCE_TIMEOUT_SEC)
+                except asyncio.TimeoutError as exc:
+                    raise HTTPException(status_code=504, detail="Inference timeout") from exc
+        finally:
+            self.inflight -= 1
+
+    async def transcribe(self, audio: np.ndarray, language: str = "auto", use_itn: bool = False, partial: bool = False) -> dict:
         if not self.ready:
             detail = self.startup_error or "Model is not ready"
             raise HTTPException(status_code=503, detail=detail)
@@ -265,14 +553,8 @@ class ASRService:
             return {"text": "", "latency_ms": 0, "audio_duration": 0.0, "rtf": 0.0}
         audio_duration = audio.size / SAMPLE_RATE
         start = time.perf_counter()
-        async with self.semaphore:
-            try:
-                text = await asyncio.wait_for(
-                    asyncio.to_thread(self._infer_sync, audio, language, use_itn),
-                    timeout=INFERENCE_TIMEOUT_SEC,
-                )
-            except asyncio.TimeoutError as exc:
-                raise HTTPException(status_code=504, detail="Inference timeout") from exc
+        semaphore = self.partial_semaphore if partial else self.semaphore
+        text = await self._run_inference(semaphore, self._infer_sync, audio, language, use_itn, partial)
         latency = time.perf_counter() - start
         return {
             "text": text,
@@ -281,6 +563,62 @@ class ASRService:
             "rtf": round(latency / audio_duration, 4) if audio_duration > 0 else 0.0,
         }
 
+    async def transcribe_fbank(self, fbank: np.ndarray, num_samples: int, language: str = "auto", use_itn: bool = False) -> dict:
+        """Like ``transcribe`` but starts from fbank frames computed while the audio was uploading."""
+        if not self.ready:
+            detail = self.startup_error or "Model is not ready"
+            raise HTTPException(status_code=503, detail=detail)
+        if fbank.shape[0] == 0:
+            return {"text": "", "latency_ms": 0, "audio_duration": 0.0, "rtf": 0.0}
+        audio_duration = num_samples / SAMPLE_RATE
+        start = time.perf_counter()
+        texts = await self._run_inference(self.semaphore, self._infer_fbank_batch_sync, [fbank], language, use_itn)
+        latency = time.perf_counter() - start
+        return {
+            "text": texts[0],
+            "latency_ms": int(latency * 1000),
+            "audio_duration": round(audio_duration, 4),
+            "rtf": round(latency / audio_duration, 4) if audio_duration > 0 else 0.0,
+        }
+
+    async def transcribe_channels(self, channels: np.ndarray, language: str = "auto", use_itn: bool = False) -> dict:
+        """Segments every channel and transcribes the segments of all channels together in shared batches."""
+        if not self.ready:
+            detail = self.startup_error or "Model is not ready"
+            raise HTTPException(status_code=503, detail=detail)
+        audio_duration = channels.shape[1] / SAMPLE_RATE if channels.size else 0.0
+        segment_index = []
+        segment_audio = []
+        for channel_idx, channel in enumerate(channels):
+            for start, end in split_voiced_segments(channel):
+                segment_index.append((channel_idx, start, end))
+                segment_audio.append(channel[start:end])
+        # Sorting by length keeps padding inside each batch small.
+        order = sorted(range(len(segment_audio)), key=lambda i: segment_audio[i].size)
+        start_time = time.perf_counter()
+        texts = []
+        # One semaphore slot and one INFERENCE_TIMEOUT_SEC per batch, so long recordings interleave with other requests.
+        batch_size = max(1, PER_CHANNEL_BATCH_SIZE)
+        for beg_idx in range(0, len(order), batch_size):
+            batch = [segment_audio[i] for i in order[beg_idx : beg_idx + batch_size]]
+            texts.extend(await self._run_inference(self.semaphore, self._infer_batch_sync, batch, language, use_itn))
+        latency = time.perf_counter() - start_time
+        results = [{"channel": idx, "text": "", "segments": []} for idx in range(channels.shape[0])]
+        for text, i in sorted(zip(texts, order), key=lambda item: item[1]):
+            channel_idx, start, end = segment_index[i]
+            results[channel_idx]["segments"].append(
+                {"start": round(start / SAMPLE_RATE, 3), "end": round(end / SAMPLE_RATE, 3), "text": text}
+            )
+        for result in results:
+            result["text"] = " ".join(seg["text"] for seg in result["segments"] if seg["text"])
+        return {
+            "channels": results,
+            "segment_count": len(segment_audio),
+            "latency_ms": int(latency * 1000),
+            "audio_duration": round(audio_duration, 4),
+            "rtf": round(latency / audio_duration, 4) if audio_duration > 0 else 0.0,
+        }
+
     def health(self) -> dict:
         return {
             "ready": self.ready,
@@ -289,6 +627,11 @@ class ASRService:
             "model_size_mb": round(self.model_size_mb, 2),
             "uptime_sec": int(time.time() - self.started_at),
             "max_concurrent_inference": MAX_CONCURRENT_INFERENCE,
+            "inflight_inference": self.inflight,
+            "ws_sessions": self.ws_sessions,
+            "cascade": self.cascade,
+            "partial_model_name": self.partial_model_name,
+            "max_concurrent_partial_inference": MAX_CONCURRENT_PARTIAL_INFERENCE if self.cascade else None,
             "startup_error": self.startup_error,
         }
 
@@ -358,21 +701,40 @@ async def favicon():
     return Response(status_code=204)
 
 
+async def transcribe_pcm_body(request: Request, trim_silence: bool) -> dict:
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_MB * 1024 * 1024:
+        raise HTTPException(status_code=413, detail=f"PCM body too large, max {MAX_UPLOAD_MB}MB")
+    # Fbank and silence detection run per chunk while the (possibly chunked) body is still arriving;
+    # only LFR/CMVN and the encoder are left once the last byte lands.
+    upload = PCMUploadBuffer.create(asr_service.fbank_options(), trim_silence=trim_silence)
+    async for chunk in request.stream():
+        if chunk:
+            await asyncio.to_thread(upload.feed, chunk)
+    if upload.received_bytes < MIN_PCM_BYTES:
+        return {"text": "", "latency_ms": 0, "audio_duration": 0.0, "trimmed_duration": 0.0, "rtf": 0.0}
+    language = request.query_params.get("language", "auto")
+    use_itn = str_to_bool(request.query_params.get("use_itn", str(DEFAULT_USE_ITN).lower()))
+    fbank, kept_samples = await asyncio.to_thread(upload.finish)
+    result = await asr_service.transcribe_fbank(fbank, kept_samples, language=language, use_itn=use_itn)
+    # Durations describe the upload; trimmed_duration is what actually reached the model.
+    received_duration = upload.num_samples / SAMPLE_RATE
+    result["trimmed_duration"] = result["audio_duration"]
+    result["audio_duration"] = round(received_duration, 4)
+    result["rtf"] = round(result["latency_ms"] / 1000 / received_duration, 4) if received_duration > 0 else 0.0
+    return result
+
+
 @app.post("/api/transcribe/pcm")
 @app.post("/transcribe/pcm")
 async def transcribe_pcm(request: Request):
-    body_bytes = await request.body()
-    if not body_bytes or len(body_bytes) < MIN_PCM_BYTES:
-        return {"text": "", "latency_ms": 0, "audio_duration": 0.0, "rtf": 0.0}
-    language = request.query_params.get("language", "auto")
-    use_itn = str_to_bool(request.query_params.get("use_itn", str(DEFAULT_USE_ITN).lower()))
-    audio = pcm16_bytes_to_float32(body_bytes)
-    return await asr_service.transcribe(audio, language=language, use_itn=use_itn)
+    return await transcribe_pcm_body(request, trim_silence=PCM_TRIM_SILENCE)
 
 
 @app.post("/transcribe_stream")
 async def transcribe_stream_compat(request: Request):
-    return await transcribe_pcm(request)
+    # Legacy route keeps the untrimmed behaviour so quiet input is never dropped.
+    return await transcribe_pcm_body(request, trim_silence=False)
 
 
 @app.post("/api/transcribe/file")
@@ -381,6 +743,7 @@ async def transcribe_file(
     file: UploadFile = File(...),
     language: str = "auto",
     use_itn: Optional[bool] = None,
+    per_channel: bool = False,
 ):
     payload = await file.read()
     if not payload:
@@ -388,12 +751,17 @@ async def transcribe_file(
     if len(payload) > MAX_UPLOAD_MB * 1024 * 1024:
         raise HTTPException(status_code=413, detail=f"File too large, max {MAX_UPLOAD_MB}MB")
     try:
-        audio = await asyncio.to_thread(decode_audio_via_ffmpeg, payload, file.filename or "audio.bin")
+        audio = await asyncio.to_thread(
+            decode_audio_via_ffmpeg, payload, file.filename or "audio.bin", mix_down=not per_channel
+        )
     except RuntimeError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     if use_itn is None:
         use_itn = DEFAULT_USE_ITN
-    result = await asr_service.transcribe(audio, language=language, use_itn=use_itn)
+    if per_channel:
+        result = await asr_service.transcribe_channels(audio, language=language, use_itn=use_itn)
+    else:
+        result = await asr_service.transcribe(audio, language=language, use_itn=use_itn)
     result["filename"] = file.filename
     return result
 
@@ -411,6 +779,7 @@ async def ws_transcribe(ws: WebSocket):
     language = ws.query_params.get("language", "auto")
     use_itn = str_to_bool(ws.query_params.get("use_itn", str(DEFAULT_USE_ITN).lower()))
     session = StreamSession.create()
+    asr_service.ws_sessions += 1
     try:
         await ws.send_json({"event": "ready", "sample_rate": SAMPLE_RATE})
         while True:
@@ -422,7 +791,9 @@ async def ws_transcribe(ws: WebSocket):
                 if len(data) >= 2:
                     session.append(data)
                     if session.total_samples >= session.next_partial_threshold:
-                        partial = await asr_service.transcribe(session.as_float32(), language=language, use_itn=use_itn)
+                        partial = await asr_service.transcribe(
+                            session.tail_float32(WS_PARTIAL_WINDOW_SEC), language=language, use_itn=use_itn, partial=True
+                        )
                         await send_ws_result(ws, "partial", partial)
                         session.next_partial_threshold = session.total_samples + session.partial_interval_samples
                 continue
@@ -464,6 +835,7 @@ async def ws_transcribe(ws: WebSocket):
         except Exception:
             pass
     finally:
+        asr_service.ws_sessions -= 1
         try:
             if ws.application_state in {WebSocketState.CONNECTED, WebSocketState.CONNECTING}:
                 await ws.close()
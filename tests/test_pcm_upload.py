@@ -0,0 +1,112 @@
+import kaldi_native_fbank as knf
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+import server
+
+
+def fbank_options() -> knf.FbankOptions:
+    # Same settings as funasr_onnx's WavFrontend, minus dither so results are deterministic.
+    opts = knf.FbankOptions()
+    opts.frame_opts.samp_freq = server.SAMPLE_RATE
+    opts.frame_opts.dither = 0.0
+    opts.frame_opts.window_type = "hamming"
+    opts.frame_opts.frame_shift_ms = 10.0
+    opts.frame_opts.frame_length_ms = 25.0
+    opts.mel_opts.num_bins = 80
+    opts.energy_floor = 0
+    opts.frame_opts.snip_edges = True
+    return opts
+
+
+def reference_fbank(audio: np.ndarray) -> np.ndarray:
+    fbank = knf.OnlineFbank(fbank_options())
+    fbank.accept_waveform(server.SAMPLE_RATE, (audio * 32768.0).tolist())
+    fbank.input_finished()
+    return np.array([fbank.get_frame(i) for i in range(fbank.num_frames_ready)], dtype=np.float32)
+
+
+def to_pcm(audio: np.ndarray) -> bytes:
+    return (audio * 32768.0).astype(np.int16).tobytes()
+
+
+def speech_between_silence(rng: np.random.Generator) -> np.ndarray:
+    audio = np.zeros(3 * server.SAMPLE_RATE, dtype=np.float32)
+    audio[server.SAMPLE_RATE : 2 * server.SAMPLE_RATE] = 0.2 * rng.standard_normal(server.SAMPLE_RATE)
+    # Round-trip through int16 so the reference sees exactly what the buffer decodes.
+    return np.frombuffer(to_pcm(np.clip(audio, -1, 0.99)), dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def feed_in_chunks(upload: server.PCMUploadBuffer, body: bytes, sizes) -> None:
+    offset = 0
+    for size in sizes:
+        upload.feed(body[offset : offset + size])
+        offset += size
+    upload.feed(body[offset:])
+
+
+def test_chunk_boundaries_do_not_change_result():
+    rng = np.random.default_rng(0)
+    body = to_pcm(speech_between_silence(rng)) + b"\x01"
+    whole = server.PCMUploadBuffer.create(fbank_options())
+    whole.feed(body)
+    whole_feats, whole_kept = whole.finish()
+
+    chunked = server.PCMUploadBuffer.create(fbank_options())
+    feed_in_chunks(chunked, body, [1, 3, 959, 961, 7] + list(rng.integers(1, 5000, size=20)))
+    chunked_feats, chunked_kept = chunked.finish()
+
+    assert chunked.received_bytes == len(body)
+    # The odd trailing byte is dropped, never decoded as half a sample.
+    assert chunked.num_samples == len(body) // 2
+    assert chunked.trim_bounds() == whole.trim_bounds()
+    assert chunked_kept == whole_kept
+    np.testing.assert_array_equal(chunked_feats, whole_feats)
+
+
+def test_trim_keeps_padded_speech_and_matches_offline_fbank():
+    audio = speech_between_silence(np.random.default_rng(1))
+    upload = server.PCMUploadBuffer.create(fbank_options())
+    upload.feed(to_pcm(audio))
+    feats, kept = upload.finish()
+
+    start, end = upload.trim_bounds()
+    pad = int(server.SAMPLE_RATE * server.PCM_SILENCE_PAD_SEC)
+    assert start % upload.frame_shift == 0
+    # Voice bounds snap to whole VAD frames, the start additionally to the fbank frame shift.
+    slack = server.VAD_FRAME_SAMPLES
+    assert server.SAMPLE_RATE - pad - slack - upload.frame_shift < start <= server.SAMPLE_RATE - pad
+    assert 2 * server.SAMPLE_RATE + pad - slack <= end <= 2 * server.SAMPLE_RATE + pad + slack
+    assert kept == end - start
+    np.testing.assert_allclose(feats, reference_fbank(audio[start:end]), rtol=1e-5, atol=1e-4)
+
+
+def test_quiet_input_is_not_trimmed():
+    audio = (0.001 * np.random.default_rng(2).standard_normal(server.SAMPLE_RATE)).astype(np.float32)
+    upload = server.PCMUploadBuffer.create(fbank_options())
+    upload.feed(to_pcm(audio))
+    feats, kept = upload.finish()
+
+    assert upload.trim_bounds() == (0, server.SAMPLE_RATE)
+    assert kept == server.SAMPLE_RATE
+    assert feats.shape == (98, 80)
+
+
+def test_trimming_disabled_keeps_everything():
+    audio = speech_between_silence(np.random.default_rng(3))
+    upload = server.PCMUploadBuffer.create(trim_silence=False)
+    upload.feed(to_pcm(audio))
+    feats, kept = upload.finish()
+
+    assert feats is None
+    assert kept == audio.size
+
+
+def test_body_over_limit_is_rejected():
+    upload = server.PCMUploadBuffer.create()
+    upload.max_bytes = 1000
+    upload.feed(b"\x00" * 1000)
+    with pytest.raises(HTTPException) as excinfo:
+        upload.feed(b"\x00")
+    assert excinfo.value.status_code == 413
@@ -0,0 +1,102 @@
+import asyncio
+
+import aiohttp
+import httpx
+from aiohttp import web
+
+import router
+
+
+def make_service(*urls: str) -> router.RouterService:
+    service = router.RouterService(list(urls))
+    for replica in service.replicas:
+        replica.healthy = True
+        replica.ready = True
+        replica.max_concurrent = 2
+    return service
+
+
+def test_pick_prefers_lowest_load():
+    service = make_service("http://a", "http://b", "http://c")
+    a, b, c = service.replicas
+    a.reported_inflight = 2
+    b.reported_inflight = 1
+    c.local_inflight = 1
+    c.reported_ws_sessions = 2
+    assert service.pick(set()) is b
+
+
+def test_pick_skips_excluded_and_unavailable():
+    service = make_service("http://a", "http://b", "http://c")
+    a, b, c = service.replicas
+    b.healthy = False
+    assert service.pick({"http://a"}) is c
+    assert service.pick({"http://a", "http://c"}) is None
+
+
+def test_pick_counts_local_inflight_before_next_poll():
+    service = make_service("http://a", "http://b")
+    a, b = service.replicas
+    a.local_inflight = 1
+    assert service.pick(set()) is b
+
+
+async def start_replica(status: int, hits: list):
+    async def handle(request: web.Request) -> web.Response:
+        body = await request.read()
+        hits.append(body)
+        return web.Response(status=status, body=body, headers={"Retry-After": "1"} if status != 200 else None)
+
+    app = web.Application()
+    app.router.add_post("/api/transcribe/pcm", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def post_through_router(monkeypatch, statuses: list, body: bytes):
+    hits = [[] for _ in statuses]
+    runners, urls = [], []
+    for status, replica_hits in zip(statuses, hits):
+        runner, url = await start_replica(status, replica_hits)
+        runners.append(runner)
+        urls.append(url)
+    service = make_service(*urls)
+    # Make the pick order deterministic: earlier replicas look less loaded.
+    for index, replica in enumerate(service.replicas):
+        replica.reported_inflight = index
+    service.session = aiohttp.ClientSession()
+    monkeypatch.setattr(router, "router_service", service)
+    monkeypatch.setattr(router, "RETRY_BACKOFF_SEC", 0)
+    try:
+        transport = httpx.ASGITransport(app=router.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://router") as client:
+            response = await client.post("/api/transcribe/pcm", content=body)
+    finally:
+        await service.session.close()
+        for runner in runners:
+            await runner.cleanup()
+    return response, urls, hits
+
+
+def test_forward_replays_body_after_503(monkeypatch):
+    body = bytes(range(256)) * 64
+    response, urls, hits = asyncio.run(post_through_router(monkeypatch, [503, 200], body))
+
+    assert response.status_code == 200
+    assert response.content == body
+    assert response.headers["x-routed-to"] == urls[1]
+    assert hits == [[body], [body]]
+    assert "server" not in response.headers
+    assert "date" not in response.headers
+
+
+def test_forward_returns_last_429_when_every_replica_is_busy(monkeypatch):
+    response, _, hits = asyncio.run(post_through_router(monkeypatch, [429, 429], b"pcm"))
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+    assert sum(len(replica_hits) for replica_hits in hits) == router.RETRY_ATTEMPTS
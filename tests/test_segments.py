@@ -0,0 +1,62 @@
+import numpy as np
+
+import server
+
+SR = server.SAMPLE_RATE
+
+
+def tone(seconds: float, amplitude: float = 0.2) -> np.ndarray:
+    return (amplitude * np.sin(np.arange(int(SR * seconds)) * 0.3)).astype(np.float32)
+
+
+def silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SR * seconds), dtype=np.float32)
+
+
+def test_frame_rms_pads_partial_frame():
+    samples = np.full(server.VAD_FRAME_SAMPLES + server.VAD_FRAME_SAMPLES // 2, 0.5, dtype=np.float32)
+    rms = server.frame_rms(samples)
+    np.testing.assert_allclose(rms, [0.5, 0.5 / np.sqrt(2)], rtol=1e-6)
+
+
+def test_splits_on_long_silence_with_padding():
+    audio = np.concatenate([silence(1), tone(1), silence(1), tone(1), silence(1)])
+    segments = server.split_voiced_segments(audio)
+
+    assert len(segments) == 2
+    pad = int(SR * server.PCM_SILENCE_PAD_SEC)
+    (first_start, first_end), (second_start, second_end) = segments
+    assert abs(first_start - (SR - pad)) <= server.VAD_FRAME_SAMPLES
+    assert abs(first_end - (2 * SR + pad)) <= server.VAD_FRAME_SAMPLES
+    assert first_end <= second_start
+    assert abs(second_end - (4 * SR + pad)) <= server.VAD_FRAME_SAMPLES
+
+
+def test_short_pause_does_not_split():
+    audio = np.concatenate([tone(1), silence(server.SEGMENT_MIN_SILENCE_SEC / 2), tone(1)])
+    assert server.split_voiced_segments(audio) == [(0, audio.size)]
+
+
+def test_quiet_channel_falls_back_to_whole_channel():
+    audio = (0.001 * np.random.default_rng(0).standard_normal(2 * SR)).astype(np.float32)
+    assert server.split_voiced_segments(audio) == [(0, audio.size)]
+
+
+def test_empty_and_digital_silence_yield_nothing():
+    assert server.split_voiced_segments(np.zeros(0, dtype=np.float32)) == []
+    assert server.split_voiced_segments(silence(2)) == []
+
+
+def test_long_segment_is_cut_at_quietest_frame(monkeypatch):
+    monkeypatch.setattr(server, "SEGMENT_MAX_SEC", 2)
+    audio = tone(4)
+    # A quiet dip shorter than SEGMENT_MIN_SILENCE_SEC, placed late in the first window.
+    dip = int(1.6 * SR)
+    audio[dip : dip + server.VAD_FRAME_SAMPLES * 4] *= 0.01
+    segments = server.split_voiced_segments(audio)
+
+    assert segments[0][0] == 0
+    assert dip <= segments[0][1] < dip + server.VAD_FRAME_SAMPLES * 4
+    assert all(end - start <= 2 * SR for start, end in segments)
+    assert all(prev[1] == cur[0] for prev, cur in zip(segments, segments[1:]))
+    assert segments[-1][1] == audio.size